@@ -216,10 +216,10 @@ def _get_smart_supported(supported):
 
         _protocol, devicetype = device_type.split(".")
         brand = devicetype[:4].lower()
-        components = [
+        components = {
             component["id"]
             for component in fixture_data["component_nego"]["component_list"]
-        ]
+        }
         dt = SmartDevice._get_device_type_from_components(components, device_type)
         supported_type = DEVICE_TYPE_TO_PRODUCT_GROUP[dt]
 
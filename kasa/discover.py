@@ -86,12 +86,10 @@ import binascii
 import ipaddress
 import logging
 import socket
+import sys
 from collections.abc import Awaitable
 from typing import Callable, Dict, Optional, Type, cast
 
-# When support for cpython older than 3.11 is dropped
-# async_timeout can be replaced with asyncio.timeout
-from async_timeout import timeout as asyncio_timeout
 from pydantic.v1 import BaseModel, ValidationError
 
 from kasa import Device
@@ -116,6 +114,11 @@ from kasa.json import dumps as json_dumps
 from kasa.json import loads as json_loads
 from kasa.xortransport import XorEncryption
 
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as asyncio_timeout
+else:
+    from async_timeout import timeout as asyncio_timeout
+
 _LOGGER = logging.getLogger(__name__)
 
 
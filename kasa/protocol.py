@@ -19,8 +19,6 @@ import logging
 import struct
 from abc import ABC, abstractmethod
 
-# When support for cpython older than 3.11 is dropped
-# async_timeout can be replaced with asyncio.timeout
 from .credentials import Credentials
 from .deviceconfig import DeviceConfig
 
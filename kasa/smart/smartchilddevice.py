@@ -51,8 +51,8 @@ class SmartChildDevice(SmartDevice):
         """
         req: dict[str, Any] = {}
         for module in self.modules.values():
-            if mod_query := module.query():
-                req.update(mod_query)
+            if mod_query := module._get_query():
+                req |= mod_query
         if req:
             self._last_update = await self.protocol.query(req)
             self._last_update_time = time.time()
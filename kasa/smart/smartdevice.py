@@ -5,7 +5,7 @@ from __future__ import annotations
 import base64
 import logging
 import time
-from collections.abc import Mapping, Sequence
+from collections.abc import Container, Mapping, Sequence
 from datetime import datetime, timedelta, timezone
 from typing import Any, cast
 
@@ -31,21 +31,124 @@ from .smartmodule import SmartModule
 _LOGGER = logging.getLogger(__name__)
 
 
-# List of modules that non hub devices with children, i.e. ks240/P300, report on
+# Modules that non hub devices with children, i.e. ks240/P300, report on
 # the child but only work on the parent.  See longer note below in _initialize_modules.
-# This list should be updated when creating new modules that could have the
+# This set should be updated when creating new modules that could have the
 # same issue, homekit perhaps?
-NON_HUB_PARENT_ONLY_MODULES = [DeviceModule, Time, Firmware, Cloud]
+NON_HUB_PARENT_ONLY_MODULES = frozenset({DeviceModule, Time, Firmware, Cloud})
 
 # Modules that are called as part of the init procedure on first update
 FIRST_UPDATE_MODULES = {DeviceModule, ChildDevice, Cloud}
 
+# Rules to find the device type, the first rule whose part of the device type
+# and component are both available (or None) wins.
+DEVICE_TYPE_FROM_COMPONENTS: tuple[tuple[str | None, str | None, DeviceType], ...] = (
+    ("HUB", None, DeviceType.Hub),
+    ("PLUG", "child_device", DeviceType.Strip),
+    ("PLUG", None, DeviceType.Plug),
+    (None, "light_strip", DeviceType.LightStrip),
+    ("SWITCH", "child_device", DeviceType.WallSwitch),
+    (None, "dimmer_calibration", DeviceType.Dimmer),
+    (None, "brightness", DeviceType.Bulb),
+    ("SWITCH", None, DeviceType.WallSwitch),
+    ("SENSOR", None, DeviceType.Sensor),
+    ("ENERGY", None, DeviceType.Thermostat),
+)
+
+
+def _b64encode(value: str) -> str:
+    return base64.b64encode(value.encode()).decode("ascii")
+
+
+def _net_for_scan_info(res: dict[str, Any]) -> WifiNetwork:
+    return WifiNetwork(
+        ssid=base64.b64decode(res["ssid"]).decode(),
+        cipher_type=res["cipher_type"],
+        key_type=res["key_type"],
+        channel=res["channel"],
+        signal_level=res["signal_level"],
+        bssid=res["bssid"],
+    )
+
 
 # Device must go last as the other interfaces also inherit Device
 # and python needs a consistent method resolution order.
 class SmartDevice(Device):
     """Base class to represent a SMART protocol based device."""
 
+    #: Features added if the given key is available in the device info
+    _INFO_FEATURE_SPECS: tuple[tuple[str, dict[str, Any]], ...] = (
+        (
+            "device_on",
+            {
+                "id": "state",
+                "name": "State",
+                "attribute_getter": "is_on",
+                "attribute_setter": "set_state",
+                "type": Feature.Type.Switch,
+                "category": Feature.Category.Primary,
+            },
+        ),
+        (
+            "signal_level",
+            {
+                "id": "signal_level",
+                "name": "Signal Level",
+                "attribute_getter": lambda x: x._info["signal_level"],
+                "icon": "mdi:signal",
+                "category": Feature.Category.Info,
+                "type": Feature.Type.Sensor,
+            },
+        ),
+        (
+            "rssi",
+            {
+                "id": "rssi",
+                "name": "RSSI",
+                "attribute_getter": lambda x: x._info["rssi"],
+                "icon": "mdi:signal",
+                "unit": "dBm",
+                "category": Feature.Category.Debug,
+                "type": Feature.Type.Sensor,
+            },
+        ),
+        (
+            "ssid",
+            {
+                "id": "ssid",
+                "name": "SSID",
+                "attribute_getter": "ssid",
+                "icon": "mdi:wifi",
+                "category": Feature.Category.Debug,
+                "type": Feature.Type.Sensor,
+            },
+        ),
+        (
+            "overheated",
+            {
+                "id": "overheated",
+                "name": "Overheated",
+                "attribute_getter": lambda x: x._info["overheated"],
+                "icon": "mdi:heat-wave",
+                "type": Feature.Type.BinarySensor,
+                "category": Feature.Category.Info,
+            },
+        ),
+        # We check for the key available, and not for the property truthiness,
+        # as the value is falsy when the device is off.
+        (
+            "on_time",
+            {
+                "id": "on_since",
+                "name": "On since",
+                "attribute_getter": "on_since",
+                "icon": "mdi:clock",
+                "category": Feature.Category.Debug,
+                "type": Feature.Type.Sensor,
+            },
+        ),
+    )
+
     def __init__(
         self,
         host: str,
@@ -64,8 +167,12 @@ class SmartDevice(Device):
         self._modules: dict[str | ModuleName[Module], SmartModule] = {}
         self._parent: SmartDevice | None = None
         self._children: Mapping[str, SmartDevice] = {}
+        self._children_tuple: tuple[SmartDevice, ...] = ()
         self._last_update = {}
         self._last_update_time: float | None = None
+        # Raw and decoded values of the base64 encoded nickname and ssid
+        self._alias_cache: tuple[str | None, str | None] = (None, None)
+        self._ssid_cache: tuple[str | None, str | None] = (None, None)
 
     async def _initialize_children(self):
         """Initialize children for power strips."""
@@ -95,11 +202,12 @@ class SmartDevice(Device):
             )
             for child_info in children
         }
+        self._children_tuple = tuple(self._children.values())
 
     @property
     def children(self) -> Sequence[SmartDevice]:
         """Return list of children."""
-        return list(self._children.values())
+        return self._children_tuple
 
     @property
     def modules(self) -> ModuleMapping[SmartModule]:
@@ -108,6 +216,9 @@ class SmartDevice(Device):
 
     def _try_get_response(self, responses: dict, request: str, default=None) -> dict:
         response = responses.get(request)
+        # Fast path for the common case of a successful response
+        if type(response) is dict:  # noqa: E721
+            return response
         if isinstance(response, SmartErrorCode):
             _LOGGER.debug(
                 "Error %s getting request %s for device %s",
@@ -137,11 +248,11 @@ class SmartDevice(Device):
         }
         resp = await self.protocol.query(initial_query)
 
+        self._info = self._try_get_response(resp, "get_device_info")
         # Save the initial state to allow modules access the device info already
         # during the initialization, which is necessary as some information like the
         # supported color temperature range is contained within the response.
         self._last_update.update(resp)
-        self._info = self._try_get_response(resp, "get_device_info")
 
         # Create our internal presentation of available components
         self._components_raw = resp["component_nego"]
@@ -150,7 +261,7 @@ class SmartDevice(Device):
             for comp in self._components_raw["component_list"]
         }
 
-        if "child_device" in self._components and not self.children:
+        if "child_device" in self._components and not self._children:
             await self._initialize_children()
 
     async def update(self, update_children: bool = False):
@@ -178,8 +289,17 @@ class SmartDevice(Device):
             self._last_update, "get_child_device_list", {}
         ):
             for info in child_info["child_device_list"]:
-                self._children[info["device_id"]]._update_internal_state(info)
-
+                if (listed_child := self._children.get(info["device_id"])) is None:
+                    _LOGGER.warning(
+                        "Unknown child device %s reported by %s",
+                        info["device_id"],
+                        self.host,
+                    )
+                    continue
+                listed_child._update_internal_state(info)
+
+        # Not fused with the loop above as the module hooks must run for every
+        # child, including children missing from the child device list.
         for child in self._children.values():
             errors = []
             for child_module_name, child_module in child._modules.items():
@@ -220,12 +340,9 @@ class SmartDevice(Device):
         # Keep a track of actual module queries so we can track the time for
         # modules that do not need to be updated frequently
         module_queries: list[SmartModule] = []
-        mq = {
-            module: query
-            for module in self._modules.values()
-            if (query := module.query())
-        }
-        for module, query in mq.items():
+        for module in self._modules.values():
+            if not (query := module._get_query()):
+                continue
             if first_update and module.__class__ in FIRST_UPDATE_MODULES:
                 module._last_update_time = update_time
                 continue
@@ -236,13 +353,14 @@ class SmartDevice(Device):
                 >= module.MINIMUM_UPDATE_INTERVAL_SECS
             ):
                 module_queries.append(module)
-                req.update(query)
+                req |= query
 
-        _LOGGER.debug(
-            "Querying %s for modules: %s",
-            self.host,
-            ", ".join(mod.name for mod in module_queries),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Querying %s for modules: %s",
+                self.host,
+                ", ".join(mod.name for mod in module_queries),
+            )
 
         try:
             resp = await self.protocol.query(req)
@@ -278,8 +396,9 @@ class SmartDevice(Device):
     ) -> dict[str, Any]:
         """Handle an error on calling module update.
 
-        Will try to call all modules individually
-        and any errors such as timeouts will be set as a SmartErrorCode.
+        Will bisect the failed requests, querying the halves separately until
+        the failing requests are isolated, and any errors such as timeouts
+        on individual requests will be set as a SmartErrorCode.
         """
         msg_part = "on first update" if first_update else "after first update"
 
@@ -290,20 +409,39 @@ class SmartDevice(Device):
             msg_part,
             ex,
         )
-        responses = {}
-        for meth, params in requests.items():
+        return await self._bisect_failed_query(requests, ex, msg_part)
+
+    async def _bisect_failed_query(
+        self, requests: dict[str, Any], ex: Exception, msg_part: str
+    ) -> dict[str, Any]:
+        """Find the failing requests of a batch which failed with the given error.
+
+        The batch is split in halves which are queried separately and halves
+        failing again are split further, isolating a single failing request
+        in a logarithmic number of round-trips.
+        """
+        if len(requests) == 1:
+            meth = next(iter(requests))
+            _LOGGER.error(
+                "Error querying %s individually for module query '%s' %s: %s",
+                self.host,
+                meth,
+                msg_part,
+                ex,
+            )
+            return {meth: SmartErrorCode.INTERNAL_QUERY_ERROR}
+
+        items = list(requests.items())
+        half = len(items) // 2
+        responses: dict[str, Any] = {}
+        for half_requests in (dict(items[:half]), dict(items[half:])):
             try:
-                resp = await self.protocol.query({meth: params})
-                responses[meth] = resp[meth]
+                resp = await self.protocol.query(half_requests)
+                responses.update({meth: resp[meth] for meth in half_requests})
             except Exception as iex:
-                _LOGGER.error(
-                    "Error querying %s individually for module query '%s' %s: %s",
-                    self.host,
-                    meth,
-                    msg_part,
-                    iex,
+                responses.update(
+                    await self._bisect_failed_query(half_requests, iex, msg_part)
                 )
-                responses[meth] = SmartErrorCode.INTERNAL_QUERY_ERROR
         return responses
 
     async def _initialize_modules(self):
@@ -318,7 +456,7 @@ class SmartDevice(Device):
         # It also ensures that devices like power strips do not add modules such as
         # firmware to the child devices.
         skip_parent_only_modules = False
-        child_modules_to_skip = {}
+        child_modules_to_skip: set[str] = set()
         if self._parent and self._parent.device_type != DeviceType.Hub:
             skip_parent_only_modules = True
 
@@ -360,86 +498,9 @@ class SmartDevice(Device):
                 type=Feature.Type.Sensor,
             )
         )
-        if "device_on" in self._info:
-            self._add_feature(
-                Feature(
-                    self,
-                    id="state",
-                    name="State",
-                    attribute_getter="is_on",
-                    attribute_setter="set_state",
-                    type=Feature.Type.Switch,
-                    category=Feature.Category.Primary,
-                )
-            )
-
-        if "signal_level" in self._info:
-            self._add_feature(
-                Feature(
-                    self,
-                    id="signal_level",
-                    name="Signal Level",
-                    attribute_getter=lambda x: x._info["signal_level"],
-                    icon="mdi:signal",
-                    category=Feature.Category.Info,
-                    type=Feature.Type.Sensor,
-                )
-            )
-
-        if "rssi" in self._info:
-            self._add_feature(
-                Feature(
-                    self,
-                    id="rssi",
-                    name="RSSI",
-                    attribute_getter=lambda x: x._info["rssi"],
-                    icon="mdi:signal",
-                    unit="dBm",
-                    category=Feature.Category.Debug,
-                    type=Feature.Type.Sensor,
-                )
-            )
-
-        if "ssid" in self._info:
-            self._add_feature(
-                Feature(
-                    device=self,
-                    id="ssid",
-                    name="SSID",
-                    attribute_getter="ssid",
-                    icon="mdi:wifi",
-                    category=Feature.Category.Debug,
-                    type=Feature.Type.Sensor,
-                )
-            )
-
-        if "overheated" in self._info:
-            self._add_feature(
-                Feature(
-                    self,
-                    id="overheated",
-                    name="Overheated",
-                    attribute_getter=lambda x: x._info["overheated"],
-                    icon="mdi:heat-wave",
-                    type=Feature.Type.BinarySensor,
-                    category=Feature.Category.Info,
-                )
-            )
-
-        # We check for the key available, and not for the property truthiness,
-        # as the value is falsy when the device is off.
-        if "on_time" in self._info:
-            self._add_feature(
-                Feature(
-                    device=self,
-                    id="on_since",
-                    name="On since",
-                    attribute_getter="on_since",
-                    icon="mdi:clock",
-                    category=Feature.Category.Debug,
-                    type=Feature.Type.Sensor,
-                )
-            )
+        for info_key, feature_kwargs in self._INFO_FEATURE_SPECS:
+            if info_key in self._info:
+                self._add_feature(Feature(self, **feature_kwargs))
 
         for module in self.modules.values():
             module._initialize_features()
@@ -451,9 +512,9 @@ class SmartDevice(Device):
     @property
     def is_cloud_connected(self) -> bool:
         """Returns if the device is connected to the cloud."""
-        if Module.Cloud not in self.modules:
+        if (cloud := self.modules.get(Module.Cloud)) is None:
             return False
-        return self.modules[Module.Cloud].is_connected
+        return cloud.is_connected
 
     @property
     def sys_info(self) -> dict[str, Any]:
@@ -469,7 +530,9 @@ class SmartDevice(Device):
     def alias(self) -> str | None:
         """Returns the device alias or nickname."""
         if self._info and (nickname := self._info.get("nickname")):
-            return base64.b64decode(nickname).decode()
+            if nickname != self._alias_cache[0]:
+                self._alias_cache = (nickname, base64.b64decode(nickname).decode())
+            return self._alias_cache[1]
         else:
             return None
 
@@ -551,6 +614,7 @@ class SmartDevice(Device):
         This is used by the parent to push updates to its children.
         """
         self._info = info
+        self._alias_cache = self._ssid_cache = (None, None)
 
     async def _query_helper(
         self, method: str, params: dict | None = None, child_ids=None
@@ -562,9 +626,11 @@ class SmartDevice(Device):
     @property
     def ssid(self) -> str:
         """Return ssid of the connected wifi ap."""
-        ssid = self._info.get("ssid")
-        ssid = base64.b64decode(ssid).decode() if ssid else "No SSID"
-        return ssid
+        if not (ssid := self._info.get("ssid")):
+            return "No SSID"
+        if ssid != self._ssid_cache[0]:
+            self._ssid_cache = (ssid, base64.b64decode(ssid).decode())
+        return cast(str, self._ssid_cache[1])
 
     @property
     def has_emeter(self) -> bool:
@@ -595,20 +661,10 @@ class SmartDevice(Device):
         """Update state from info from the discover call."""
         self._discovery_info = info
         self._info = info
+        self._alias_cache = self._ssid_cache = (None, None)
 
     async def wifi_scan(self) -> list[WifiNetwork]:
         """Scan for available wifi networks."""
-
-        def _net_for_scan_info(res):
-            return WifiNetwork(
-                ssid=base64.b64decode(res["ssid"]).decode(),
-                cipher_type=res["cipher_type"],
-                key_type=res["key_type"],
-                channel=res["channel"],
-                signal_level=res["signal_level"],
-                bssid=res["bssid"],
-            )
-
         _LOGGER.debug("Querying networks")
 
         resp = await self.protocol.query({"get_wireless_scan_info": {"start_index": 0}})
@@ -631,17 +687,13 @@ class SmartDevice(Device):
 
         payload = {
             "account": {
-                "username": base64.b64encode(
-                    self.credentials.username.encode()
-                ).decode(),
-                "password": base64.b64encode(
-                    self.credentials.password.encode()
-                ).decode(),
+                "username": _b64encode(self.credentials.username),
+                "password": _b64encode(self.credentials.password),
             },
             "wireless": {
                 "key_type": keytype,
-                "password": base64.b64encode(password.encode()).decode(),
-                "ssid": base64.b64encode(ssid.encode()).decode(),
+                "password": _b64encode(password),
+                "ssid": _b64encode(ssid),
             },
             "time": self.internal_state["get_device_time"],
         }
@@ -664,8 +716,8 @@ class SmartDevice(Device):
         time_data = self.internal_state["get_device_time"]
         payload = {
             "account": {
-                "username": base64.b64encode(username.encode()).decode(),
-                "password": base64.b64encode(password.encode()).decode(),
+                "username": _b64encode(username),
+                "password": _b64encode(password),
             },
             "time": time_data,
         }
@@ -674,7 +726,7 @@ class SmartDevice(Device):
     async def set_alias(self, alias: str):
         """Set the device name (alias)."""
         return await self.protocol.query(
-            {"set_device_info": {"nickname": base64.b64encode(alias.encode()).decode()}}
+            {"set_device_info": {"nickname": _b64encode(alias)}}
         )
 
     async def reboot(self, delay: int = 1) -> None:
@@ -699,35 +751,20 @@ class SmartDevice(Device):
             return self._device_type
 
         self._device_type = self._get_device_type_from_components(
-            list(self._components.keys()), self._info["type"]
+            self._components, self._info["type"]
         )
 
         return self._device_type
 
     @staticmethod
     def _get_device_type_from_components(
-        components: list[str], device_type: str
+        components: Container[str], device_type: str
     ) -> DeviceType:
         """Find type to be displayed as a supported device category."""
-        if "HUB" in device_type:
-            return DeviceType.Hub
-        if "PLUG" in device_type:
-            if "child_device" in components:
-                return DeviceType.Strip
-            return DeviceType.Plug
-        if "light_strip" in components:
-            return DeviceType.LightStrip
-        if "SWITCH" in device_type and "child_device" in components:
-            return DeviceType.WallSwitch
-        if "dimmer_calibration" in components:
-            return DeviceType.Dimmer
-        if "brightness" in components:
-            return DeviceType.Bulb
-        if "SWITCH" in device_type:
-            return DeviceType.WallSwitch
-        if "SENSOR" in device_type:
-            return DeviceType.Sensor
-        if "ENERGY" in device_type:
-            return DeviceType.Thermostat
+        for type_part, component, result in DEVICE_TYPE_FROM_COMPONENTS:
+            if (type_part is None or type_part in device_type) and (
+                component is None or component in components
+            ):
+                return result
         _LOGGER.warning("Unknown device type, falling back to plug")
         return DeviceType.Plug
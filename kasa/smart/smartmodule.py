@@ -57,6 +57,7 @@ class SmartModule(Module):
         self._device: SmartDevice
         super().__init__(device, module)
         self._last_update_time: float | None = None
+        self._cached_query: dict | None = None
 
     def __init_subclass__(cls, **kwargs):
         name = getattr(cls, "NAME", cls.__name__)
@@ -83,6 +84,16 @@ class SmartModule(Module):
         """
         return {self.QUERY_GETTER_NAME: None}
 
+    def _get_query(self) -> dict:
+        """Return the module query, reusing the result of the previous call.
+
+        Modules whose query changes after initialization must reset
+        ``_cached_query`` to None when their state changes.
+        """
+        if self._cached_query is None:
+            self._cached_query = self.query()
+        return self._cached_query
+
     def call(self, method, params=None):
         """Call a method.
 
@@ -99,7 +110,7 @@ class SmartModule(Module):
         to the main "get_device_info" response.
         """
         dev = self._device
-        q = self.query()
+        q = self._get_query()
 
         if not q:
             return dev.sys_info
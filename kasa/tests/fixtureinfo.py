@@ -136,7 +136,7 @@ def filter_fixtures(
     def _device_type_match(fixture_data: FixtureInfo, device_type):
         if (component_nego := fixture_data.data.get("component_nego")) is None:
             return _get_device_type_from_sys_info(fixture_data.data) in device_type
-        components = [component["id"] for component in component_nego["component_list"]]
+        components = {component["id"] for component in component_nego["component_list"]}
         if (info := fixture_data.data.get("get_device_info")) and (
             type_ := info.get("type")
         ):
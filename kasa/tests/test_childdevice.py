@@ -40,6 +40,19 @@ def test_childdevice_init(dev, dummy_protocol, mocker):
     assert "position" in first._info
 
 
+@strip_smart
+async def test_childdevice_children_cached(dev):
+    """Test that children are only copied when the children are initialized."""
+    children = dev.children
+    await dev.update()
+    assert dev.children is children
+    assert list(children) == list(dev._children.values())
+
+    await dev._initialize_children()
+    assert dev.children is not children
+    assert list(dev.children) == list(dev._children.values())
+
+
 @strip_smart
 async def test_childdevice_update(dev, dummy_protocol, mocker):
     """Test that parent update updates children."""
@@ -55,6 +68,43 @@ async def test_childdevice_update(dev, dummy_protocol, mocker):
     assert child_list[0] == first._info
 
 
+@has_children_smart
+@pytest.mark.parametrize(
+    "listed_children", [pytest.param(1, id="One listed"), pytest.param(0, id="None")]
+)
+async def test_childdevice_update_not_in_child_list(dev, mocker, listed_children):
+    """Test that module hooks run for children missing from the child list."""
+    if not any(child.modules for child in dev.children):
+        pytest.skip("Test requires child devices with modules")
+    child_list = dev.internal_state["get_child_device_list"]["child_device_list"]
+    mocker.patch.object(dev, "_modular_update", return_value={})
+    dev._last_update["get_child_device_list"] = {
+        "child_device_list": child_list[:listed_children]
+    }
+    hook = mocker.spy(dev, "_handle_module_post_update_hook")
+
+    await dev.update()
+
+    hooked_modules = [call.args[0] for call in hook.call_args_list]
+    for child in dev.children:
+        for module in child.modules.values():
+            assert module in hooked_modules
+
+
+@strip_smart
+async def test_childdevice_update_unknown_child(dev, mocker, caplog):
+    """Test that children unknown to the parent are logged and skipped."""
+    child_list = dev.internal_state["get_child_device_list"]["child_device_list"]
+    mocker.patch.object(dev, "_modular_update", return_value={})
+    dev._last_update["get_child_device_list"] = {
+        "child_device_list": [*child_list, {**child_list[0], "device_id": "unknown"}]
+    }
+
+    await dev.update()
+
+    assert f"Unknown child device unknown reported by {dev.host}" in caplog.text
+
+
 @strip_smart
 @pytest.mark.skipif(
     sys.version_info < (3, 11),
@@ -182,6 +182,12 @@ async def test_command_with_child(dev, mocker, runner):
     dummy_child = DummyDevice()
 
     mocker.patch.object(dev, "_children", {"XYZ": [dummy_child]})
+    mocker.patch.object(
+        dev.__class__,
+        "children",
+        new_callable=mocker.PropertyMock,
+        return_value=[dummy_child],
+    )
     mocker.patch.object(dev, "get_child_device", return_value=dummy_child)
 
     res = await runner.invoke(
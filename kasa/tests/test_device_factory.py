@@ -176,9 +176,7 @@ async def test_device_types(dev: Device):
     if isinstance(dev, SmartDevice):
         assert dev._discovery_info
         device_type = cast(str, dev._discovery_info["result"]["device_type"])
-        res = SmartDevice._get_device_type_from_components(
-            list(dev._components.keys()), device_type
-        )
+        res = SmartDevice._get_device_type_from_components(dev._components, device_type)
     else:
         res = _get_device_type_from_sys_info(dev._last_update)
 
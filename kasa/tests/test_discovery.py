@@ -4,11 +4,11 @@
 import asyncio
 import re
 import socket
+import sys
 from unittest.mock import MagicMock
 
 import aiohttp
 import pytest  # type: ignore # https://github.com/pytest-dev/pytest/issues/3342
-from async_timeout import timeout as asyncio_timeout
 
 from kasa import (
     Credentials,
@@ -36,6 +36,11 @@ from .conftest import (
     wallswitch_iot,
 )
 
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as asyncio_timeout
+else:
+    from async_timeout import timeout as asyncio_timeout
+
 UNSUPPORTED = {
     "result": {
         "device_id": "xx",
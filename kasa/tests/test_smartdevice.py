@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 import logging
 import time
 from typing import Any, cast
@@ -12,6 +13,7 @@ from freezegun.api import FrozenDateTimeFactory
 from pytest_mock import MockerFixture
 
 from kasa import Device, KasaException, Module
+from kasa import TimeoutError as KasaTimeoutError
 from kasa.exceptions import SmartErrorCode
 from kasa.smart import SmartDevice
 
@@ -139,6 +141,21 @@ async def test_update_module_queries(dev: SmartDevice, mocker: MockerFixture):
             spies[device].assert_not_called()
 
 
+@device_smart
+async def test_update_module_queries_cached(dev: SmartDevice, mocker: MockerFixture):
+    """Test that module queries are not rebuilt on every update."""
+    new_dev = SmartDevice("127.0.0.1", protocol=dev.protocol)
+    await new_dev.update()
+
+    spies = {
+        modname: mocker.spy(module, "query")
+        for modname, module in new_dev._modules.items()
+    }
+    await new_dev.update()
+    for modname, spy in spies.items():
+        assert spy.call_count == 0, f"{modname} query was called"
+
+
 @device_smart
 async def test_update_module_errors(dev: SmartDevice, mocker: MockerFixture):
     """Test that modules that error are disabled / removed."""
@@ -328,6 +345,96 @@ async def test_update_module_query_errors(
                 assert msg in caplog.text
 
 
+@pytest.mark.parametrize(
+    ("bad_queries", "multi_key_fails", "expected_call_count"),
+    [
+        pytest.param(set(), False, 2, id="Retry succeeds"),
+        pytest.param({"get_dummy_5"}, False, 6, id="Single bad query"),
+        pytest.param(
+            {"get_dummy_1", "get_dummy_5"}, False, 10, id="Bad queries in both halves"
+        ),
+        pytest.param(set(), True, 14, id="Multi key queries time out"),
+    ],
+)
+async def test_handle_modular_update_error_bisects(
+    mocker: MockerFixture,
+    caplog: pytest.LogCaptureFixture,
+    bad_queries,
+    multi_key_fails,
+    expected_call_count,
+):
+    """Test that failing queries are isolated by bisecting the requests."""
+    dev = SmartDevice("127.0.0.1")
+    requests: dict[str, Any] = {f"get_dummy_{i}": None for i in range(8)}
+
+    async def _query(request, *args, **kwargs):
+        if bad_queries & request.keys():
+            raise KasaException("Dummy error")
+        if multi_key_fails and len(request) > 1:
+            raise KasaTimeoutError("Dummy timeout")
+        return {meth: {"method": meth} for meth in request}
+
+    query_mock = mocker.patch.object(dev.protocol, "query", side_effect=_query)
+
+    resp = await dev._handle_modular_update_error(
+        KasaTimeoutError("Dummy timeout"), False, "", requests
+    )
+    assert query_mock.call_count == expected_call_count
+    for meth in requests:
+        if meth in bad_queries:
+            assert resp[meth] is SmartErrorCode.INTERNAL_QUERY_ERROR
+        else:
+            assert resp[meth] == {"method": meth}
+    if bad_queries:
+        for meth in bad_queries:
+            msg = f"Error querying {dev.host} individually for module query '{meth}"
+            assert msg in caplog.text
+    else:
+        assert "individually" not in caplog.text
+
+
+@device_smart
+async def test_update_module_multi_query_timeout(
+    dev: SmartDevice,
+    mocker: MockerFixture,
+    caplog: pytest.LogCaptureFixture,
+):
+    """Test that modules are kept when only the batched queries time out."""
+    assert dev._modules
+
+    new_dev = SmartDevice("127.0.0.1", protocol=dev.protocol)
+
+    async def _query(request, *args, **kwargs):
+        if (
+            isinstance(request, dict)
+            and len(request) > 1
+            and "component_nego" not in request
+            and "get_child_device_component_list" not in request
+        ):
+            raise KasaTimeoutError("Dummy timeout")
+        return await dev.protocol._query(request, *args, **kwargs)
+
+    from kasa.smartprotocol import _ChildProtocolWrapper
+
+    child_protocols = {
+        cast(_ChildProtocolWrapper, child.protocol)._device_id: child.protocol
+        for child in dev.children
+    }
+
+    async def _child_query(self, request, *args, **kwargs):
+        return await child_protocols[self._device_id]._query(request, *args, **kwargs)
+
+    mocker.patch.object(new_dev.protocol, "query", side_effect=_query)
+    # children not created yet so cannot patch.object
+    mocker.patch("kasa.smartprotocol._ChildProtocolWrapper.query", new=_child_query)
+
+    await new_dev.update()
+    msg = f"Error querying {new_dev.host} for modules"
+    assert msg in caplog.text
+    assert new_dev._modules.keys() == dev._modules.keys()
+    assert "individually" not in caplog.text
+
+
 async def test_get_modules():
     """Test getting modules for child and parent modules."""
     dummy_device = await get_device_for_fixture_protocol(
@@ -362,6 +469,27 @@ async def test_get_modules():
     assert module is None
 
 
+@device_smart
+async def test_alias_and_ssid_decoded_once(dev: SmartDevice, mocker: MockerFixture):
+    """Test that the base64 encoded alias and ssid are only decoded on change."""
+
+    def _encode(value: str) -> str:
+        return base64.b64encode(value.encode()).decode()
+
+    info = {**dev._info, "nickname": _encode("Alias"), "ssid": _encode("SSID")}
+    dev._update_internal_state(info)
+    b64decode = mocker.spy(base64, "b64decode")
+
+    for _ in range(2):
+        assert dev.alias == "Alias"
+        assert dev.ssid == "SSID"
+    assert b64decode.call_count == 2
+
+    dev._info["nickname"] = _encode("New alias")
+    assert dev.alias == "New alias"
+    assert b64decode.call_count == 3
+
+
 @device_smart
 async def test_smartdevice_cloud_connection(dev: SmartDevice, mocker: MockerFixture):
     """Test is_cloud_connected property."""
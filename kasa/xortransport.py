@@ -18,18 +18,20 @@ import errno
 import logging
 import socket
 import struct
+import sys
 from collections.abc import Generator
 from pprint import pformat as pf
 
-# When support for cpython older than 3.11 is dropped
-# async_timeout can be replaced with asyncio.timeout
-from async_timeout import timeout as asyncio_timeout
-
 from .deviceconfig import DeviceConfig
 from .exceptions import KasaException, _RetryableError
 from .json import loads as json_loads
 from .protocol import BaseTransport
 
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as asyncio_timeout
+else:
+    from async_timeout import timeout as asyncio_timeout
+
 _LOGGER = logging.getLogger(__name__)
 _NO_RETRY_ERRORS = {errno.EHOSTDOWN, errno.EHOSTUNREACH, errno.ECONNREFUSED}
 _UNSIGNED_INT_NETWORK_ORDER = struct.Struct(">I")